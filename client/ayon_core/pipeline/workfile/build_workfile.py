@@ -10,8 +10,9 @@ more abilities to define how build happens but require more code to achive it.
 """
 
 import re
+import copy
 import collections
-import json
+import itertools
 
 import ayon_api
 
@@ -19,11 +20,13 @@ from ayon_core.settings import get_project_settings
 from ayon_core.lib import (
     filter_profiles,
     Logger,
+    NestedCacheItem,
 )
 from ayon_core.pipeline.load import (
     discover_loader_plugins,
     IncompatibleLoaderError,
-    load_container,
+    get_representation_contexts,
+    load_with_repre_context,
 )
 
 
@@ -35,6 +38,8 @@ class BuildWorkfile:
     """
 
     _log = None
+    # Linked folder entities cached per project name and folder id
+    _linked_folders_cache = NestedCacheItem(levels=2, lifetime=60)
 
     @property
     def log(self):
@@ -110,16 +115,7 @@ class BuildWorkfile:
             return loaded_containers
 
         # Prepare available loaders
-        loaders_by_name = {}
-        for loader in discover_loader_plugins():
-            if not loader.enabled:
-                continue
-            loader_name = loader.__name__
-            if loader_name in loaders_by_name:
-                raise KeyError(
-                    "Duplicated loader name {0}!".format(loader_name)
-                )
-            loaders_by_name[loader_name] = loader
+        loaders_by_name = self._get_loaders_by_name(project_name)
 
         # Skip if there are any loaders
         if not loaders_by_name:
@@ -178,8 +174,12 @@ class BuildWorkfile:
             linked_folder_entities = self._get_linked_folder_entities(
                 project_name, current_folder_entity["id"]
             )
-            if linked_folder_entities:
-                folder_entities.extend(linked_folder_entities)
+            # Current folder is already in the list if linked to itself
+            folder_entities.extend(
+                folder_entity
+                for folder_entity in linked_folder_entities
+                if folder_entity["id"] != current_folder_id
+            )
 
         # Skip if there are no folders. This can happen if only linked mapping
         # is set and there are no links for his folder.
@@ -191,7 +191,7 @@ class BuildWorkfile:
 
         # Prepare entities from database for folders
         prepared_entities = self._collect_last_version_repres(
-            folder_entities
+            project_name, folder_entities
         )
 
         # Load containers by prepared entities and presets
@@ -199,6 +199,7 @@ class BuildWorkfile:
         if current_folder_id and current_folder_id in prepared_entities:
             current_context_data = prepared_entities.pop(current_folder_id)
             loaded_data = self.load_containers_by_folder_data(
+                project_name,
                 current_context_data,
                 current_context_profiles,
                 loaders_by_name
@@ -209,6 +210,7 @@ class BuildWorkfile:
         # - Linked assets container
         for linked_folder_data in prepared_entities.values():
             loaded_data = self.load_containers_by_folder_data(
+                project_name,
                 linked_folder_data,
                 link_context_profiles,
                 loaders_by_name
@@ -219,6 +221,35 @@ class BuildWorkfile:
         # Return list of loaded containers
         return loaded_containers
 
+    def _get_loaders_by_name(self, project_name):
+        """Enabled loader plugins mapped by their name.
+
+        Loaders are discovered once per 'process' call so registered or
+        deregistered loaders are always respected.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            Dict[str, LoaderPlugin]: Available loaders per name.
+
+        Raises:
+            KeyError: When more loaders have the same name.
+        """
+
+        loaders_by_name = {}
+        for loader in discover_loader_plugins(project_name):
+            if not loader.enabled:
+                continue
+            loader_name = loader.__name__
+            if loader_name in loaders_by_name:
+                raise KeyError(
+                    "Duplicated loader name {0}!".format(loader_name)
+                )
+            loaders_by_name[loader_name] = loader
+
+        return loaders_by_name
+
     def get_build_presets(self, task_name, folder_id):
         """ Returns presets to build workfile for task name.
 
@@ -281,7 +312,8 @@ class BuildWorkfile:
                         representation name.
 
         Lowered "families" and "repre_names" are prepared for each profile with
-        all required keys.
+        all required keys. Optional "product_name_filters" are compiled
+        to regexes.
 
         Args:
             build_profiles (Dict[str, Any]): Profiles for building workfile.
@@ -297,39 +329,37 @@ class BuildWorkfile:
             # Check loaders
             profile_loaders = profile.get("loaders")
             if not profile_loaders:
-                self.log.warning((
-                    "Build profile has missing loaders configuration: {0}"
-                ).format(json.dumps(profile, indent=4)))
+                self.log.warning(
+                    "Build profile has missing loaders configuration: %s",
+                    profile
+                )
                 continue
 
             # Check if any loader is available
-            loaders_match = False
-            for loader_name in profile_loaders:
-                if loader_name in loaders_by_name:
-                    loaders_match = True
-                    break
-
-            if not loaders_match:
-                self.log.warning((
-                    "All loaders from Build profile are not available: {0}"
-                ).format(json.dumps(profile, indent=4)))
+            if loaders_by_name.keys().isdisjoint(profile_loaders):
+                self.log.warning(
+                    "All loaders from Build profile are not available: %s",
+                    profile
+                )
                 continue
 
             # Check product types
             profile_product_types = profile.get("product_types")
             if not profile_product_types:
-                self.log.warning((
-                    "Build profile is missing families configuration: {0}"
-                ).format(json.dumps(profile, indent=4)))
+                self.log.warning(
+                    "Build profile is missing families configuration: %s",
+                    profile
+                )
                 continue
 
             # Check representation names
             profile_repre_names = profile.get("repre_names")
             if not profile_repre_names:
-                self.log.warning((
+                self.log.warning(
                     "Build profile is missing"
-                    " representation names filtering: {0}"
-                ).format(json.dumps(profile, indent=4)))
+                    " representation names filtering: %s",
+                    profile
+                )
                 continue
 
             # Prepare lowered families and representation names
@@ -340,6 +370,14 @@ class BuildWorkfile:
             profile["repre_names_lowered"] = [
                 name.lower() for name in profile_repre_names
             ]
+            profile["repre_names_lowered_set"] = set(
+                profile["repre_names_lowered"]
+            )
+            # Precompile name filters as regexes
+            profile["product_name_regexes"] = [
+                re.compile(regex)
+                for regex in profile.get("product_name_filters") or []
+            ]
 
             valid_profiles.append(profile)
 
@@ -356,6 +394,15 @@ class BuildWorkfile:
             list[dict[str, Any]]: Linked folder entities.
 
         """
+        cache_item = self._linked_folders_cache[project_name][folder_id]
+        if not cache_item.is_valid:
+            cache_item.update_data(
+                self._query_linked_folder_entities(project_name, folder_id)
+            )
+        # Return copies so callers can't modify cached entities
+        return copy.deepcopy(cache_item.get_data())
+
+    def _query_linked_folder_entities(self, project_name, folder_id):
         links = ayon_api.get_folder_links(
             project_name, folder_id, link_direction="in"
         )
@@ -391,47 +438,37 @@ class BuildWorkfile:
         # Prepare products
         products_by_type = self.map_products_by_type(product_entities)
 
+        # First matching profile is used for product type
+        profile_by_product_type = {}
+        for profile in profiles:
+            for product_type_low in profile["product_types_lowered"]:
+                profile_by_product_type.setdefault(product_type_low, profile)
+
         profiles_by_product_id = {}
         for product_type, product_entities in products_by_type.items():
-            product_type_low = product_type.lower()
-            for profile in profiles:
-                # Skip profile if does not contain product type
-                if product_type_low not in profile["product_types_lowered"]:
+            profile = profile_by_product_type.get(product_type.lower())
+            if profile is None:
+                continue
+
+            profile_regexes = profile["product_name_regexes"]
+            for product_entity in product_entities:
+                # Verify regex filtering (optional)
+                if profile_regexes and not any(
+                    pattern.match(product_entity["name"])
+                    for pattern in profile_regexes
+                ):
                     continue
 
-                # Precompile name filters as regexes
-                profile_regexes = profile.get("product_name_filters")
-                if profile_regexes:
-                    _profile_regexes = []
-                    for regex in profile_regexes:
-                        _profile_regexes.append(re.compile(regex))
-                    profile_regexes = _profile_regexes
-
-                # TODO prepare regex compilation
-                for product_entity in product_entities:
-                    # Verify regex filtering (optional)
-                    if profile_regexes:
-                        valid = False
-                        for pattern in profile_regexes:
-                            if re.match(pattern, product_entity["name"]):
-                                valid = True
-                                break
-
-                        if not valid:
-                            continue
-
-                    profiles_by_product_id[product_entity["id"]] = profile
-
-                # break profiles loop on finding the first matching profile
-                break
+                profiles_by_product_id[product_entity["id"]] = profile
         return profiles_by_product_id
 
     def load_containers_by_folder_data(
-        self, linked_folder_data, build_profiles, loaders_by_name
+        self, project_name, linked_folder_data, build_profiles, loaders_by_name
     ):
         """Load containers for entered folder entity by Build profiles.
 
         Args:
+            project_name (str): Project name.
             linked_folder_data (Dict[str, Any]): Prepared data with products,
                 last versions and representations for specific folder.
             build_profiles (Dict[str, Any]): Build profiles.
@@ -462,7 +499,7 @@ class BuildWorkfile:
 
         products_by_id = {}
         version_by_product_id = {}
-        repres_by_version_id = {}
+        repres_by_low_name_by_version_id = {}
         for product_id, in_data in linked_folder_data["products"].items():
             product_entity = in_data["product_entity"]
             products_by_id[product_entity["id"]] = product_entity
@@ -470,9 +507,10 @@ class BuildWorkfile:
             version_data = in_data["version"]
             version_entity = version_data["version_entity"]
             version_by_product_id[product_id] = version_entity
-            repres_by_version_id[version_entity["id"]] = (
-                version_data["repres"]
-            )
+            repres_by_low_name_by_version_id[version_entity["id"]] = {
+                repre["name"].lower(): repre
+                for repre in version_data["repres"]
+            }
 
         if not products_by_id:
             self.log.warning("There are not products for folder {}".format(
@@ -487,17 +525,20 @@ class BuildWorkfile:
             self.log.warning("There are not valid products.")
             return
 
-        valid_repres_by_product_id = collections.defaultdict(list)
+        valid_repres_by_product_id = {}
         for product_id, profile in profiles_by_product_id.items():
-            profile_repre_names = profile["repre_names_lowered"]
+            profile_repre_names = profile["repre_names_lowered_set"]
 
             version_entity = version_by_product_id[product_id]
             version_id = version_entity["id"]
-            repres = repres_by_version_id[version_id]
-            for repre in repres:
-                repre_name_low = repre["name"].lower()
-                if repre_name_low in profile_repre_names:
-                    valid_repres_by_product_id[product_id].append(repre)
+            repres_by_low_name = repres_by_low_name_by_version_id[version_id]
+            valid_repres = {
+                repre_name_low: repre
+                for repre_name_low, repre in repres_by_low_name.items()
+                if repre_name_low in profile_repre_names
+            }
+            if valid_repres:
+                valid_repres_by_product_id[product_id] = valid_repres
 
         # DEBUG message
         msg = "Valid representations for Folder: `{}`".format(
@@ -508,13 +549,13 @@ class BuildWorkfile:
             msg += "\n# Product Name/ID: `{}`/{}".format(
                 product_entity["name"], product_id
             )
-            for repre in repres:
+            for repre in repres.values():
                 msg += "\n## Repre name: `{}`".format(repre["name"])
 
         self.log.debug(msg)
 
         containers = self._load_containers(
-            valid_repres_by_product_id, products_by_id,
+            project_name, valid_repres_by_product_id, products_by_id,
             profiles_by_product_id, loaders_by_name
         )
 
@@ -524,7 +565,7 @@ class BuildWorkfile:
         }
 
     def _load_containers(
-        self, repres_by_product_id, products_by_id,
+        self, project_name, repres_by_product_id, products_by_id,
         profiles_by_product_id, loaders_by_name
     ):
         """Real load by collected data happens here.
@@ -539,8 +580,10 @@ class BuildWorkfile:
         all matching representations were already tried.
 
         Args:
-            repres_by_product_id (Dict[str, Dict[str, Any]]): Available
-                representations mapped by their parent (product) id.
+            project_name (str): Project name.
+            repres_by_product_id (Dict[str, Dict[str, Dict[str, Any]]]):
+                Available representations by lowered name mapped by their
+                parent (product) id.
             products_by_id (Dict[str, Dict[str, Any]]): Product entities
                 mapped by their id.
             profiles_by_product_id (Dict[str, Dict[str, Any]]): Build profiles
@@ -554,47 +597,40 @@ class BuildWorkfile:
 
         loaded_containers = []
 
-        # Get product id order from build presets.
-        build_presets = self.build_presets.get("current_context", [])
-        build_presets += self.build_presets.get("linked_assets", [])
-        product_ids_ordered = []
-        for preset in build_presets:
-            for product_type in preset["product_types"]:
-                for product_id, product_entity in products_by_id.items():
-                    # TODO 'families' is not available on product
-                    families = product_entity["data"].get("families") or []
-                    if product_type not in families:
-                        continue
-
-                    product_ids_ordered.append(product_id)
-
-        # Order representations from products.
-        print("repres_by_product_id", repres_by_product_id)
-        representations_ordered = []
-        representations = []
-        for ordered_product_id in product_ids_ordered:
-            for product_id, repres in repres_by_product_id.items():
-                if repres in representations:
-                    continue
-
-                if ordered_product_id == product_id:
-                    representations_ordered.append((product_id, repres))
-                    representations.append(repres)
+        # Order matters only if there are more products to load
+        if len(repres_by_product_id) == 1:
+            representations_ordered = list(repres_by_product_id.items())
+        else:
+            representations_ordered = self._get_ordered_representations(
+                repres_by_product_id, products_by_id
+            )
 
-        print("representations", representations)
+        # Query parents of all representations at once instead of
+        #   querying them on each load
+        try:
+            repre_contexts_by_id = get_representation_contexts(
+                project_name,
+                [
+                    repre
+                    for _, repre_by_low_name in representations_ordered
+                    for repre in repre_by_low_name.values()
+                ]
+            )
+        except Exception:
+            self.log.error(
+                "Failed to query representation contexts. Skipping load.",
+                exc_info=True
+            )
+            return loaded_containers
 
         # Load ordered representations.
-        for product_id, repres in representations_ordered:
+        for product_id, repre_by_low_name in representations_ordered:
             product_name = products_by_id[product_id]["name"]
 
             profile = profiles_by_product_id[product_id]
             loaders_last_idx = len(profile["loaders"]) - 1
             repre_names_last_idx = len(profile["repre_names_lowered"]) - 1
 
-            repre_by_low_name = {
-                repre["name"].lower(): repre for repre in repres
-            }
-
             is_loaded = False
             for repre_name_idx, profile_repre_name in enumerate(
                 profile["repre_names_lowered"]
@@ -607,6 +643,19 @@ class BuildWorkfile:
                 if not repre:
                     continue
 
+                repre_context = repre_contexts_by_id[repre["id"]]
+                missing_entities = [
+                    key
+                    for key, value in repre_context.items()
+                    if value is None
+                ]
+                if missing_entities:
+                    self.log.warning((
+                        "Not able to receive parent types {} of"
+                        " representation `{}`"
+                    ).format(", ".join(missing_entities), repre["name"]))
+                    continue
+
                 for loader_idx, loader_name in enumerate(profile["loaders"]):
                     if is_loaded:
                         break
@@ -615,44 +664,105 @@ class BuildWorkfile:
                     if not loader:
                         continue
                     try:
-                        container = load_container(
+                        container = load_with_repre_context(
                             loader,
-                            repre["id"],
+                            repre_context,
                             name=product_name
                         )
+
+                    except IncompatibleLoaderError:
+                        self.log.info((
+                            "Loader `{}` is not compatible with"
+                            " representation `{}`"
+                        ).format(loader_name, repre["name"]))
+
+                    except Exception:
+                        self.log.error(
+                            "Unexpected error happened during loading",
+                            exc_info=True
+                        )
+
+                    else:
                         loaded_containers.append(container)
                         is_loaded = True
+                        continue
 
-                    except Exception as exc:
-                        if exc == IncompatibleLoaderError:
-                            self.log.info((
-                                "Loader `{}` is not compatible with"
-                                " representation `{}`"
-                            ).format(loader_name, repre["name"]))
-
-                        else:
-                            self.log.error(
-                                "Unexpected error happened during loading",
-                                exc_info=True
-                            )
-
-                        msg = "Loading failed."
-                        if loader_idx < loaders_last_idx:
-                            msg += " Trying next loader."
-                        elif repre_name_idx < repre_names_last_idx:
-                            msg += (
-                                " Loading of product `{}` was not successful."
-                            ).format(product_name)
-                        else:
-                            msg += " Trying next representation."
-                        self.log.info(msg)
+                    msg = "Loading failed."
+                    if loader_idx < loaders_last_idx:
+                        msg += " Trying next loader."
+                    elif repre_name_idx < repre_names_last_idx:
+                        msg += (
+                            " Loading of product `{}` was not successful."
+                        ).format(product_name)
+                    else:
+                        msg += " Trying next representation."
+                    self.log.info(msg)
 
         return loaded_containers
 
-    def _collect_last_version_repres(self, folder_entities):
+    def _get_ordered_representations(
+        self, repres_by_product_id, products_by_id
+    ):
+        """Order representations of products by build presets.
+
+        Products are ordered by product types in build presets, compared
+        case-insensitively. Products that don't match any product type of
+        presets are skipped.
+
+        Args:
+            repres_by_product_id (Dict[str, Dict[str, Dict[str, Any]]]):
+                Available representations by lowered name mapped by their
+                parent (product) id.
+            products_by_id (Dict[str, Dict[str, Any]]): Product entities
+                mapped by their id.
+
+        Returns:
+            List[Tuple[str, Dict[str, Dict[str, Any]]]]: Product ids with
+                their representations by lowered name in load order.
+        """
+
+        # Get product id order from build presets.
+        build_presets = itertools.chain(
+            self.build_presets.get("current_context") or [],
+            self.build_presets.get("linked_assets") or [],
+        )
+        # Match product types lowered the same way as profiles are matched
+        #   in '_prepare_profile_for_products'
+        products_by_type_low = collections.defaultdict(list)
+        for product_type, product_entities in self.map_products_by_type(
+            products_by_id.values()
+        ).items():
+            products_by_type_low[product_type.lower()].extend(
+                product_entities
+            )
+
+        product_ids_ordered = []
+        for preset in build_presets:
+            for product_type in preset["product_types"]:
+                product_ids_ordered.extend(
+                    product_entity["id"]
+                    for product_entity in products_by_type_low.get(
+                        product_type.lower(), []
+                    )
+                )
+
+        representations_ordered = []
+        processed_product_ids = set()
+        for product_id in product_ids_ordered:
+            if product_id in processed_product_ids:
+                continue
+            processed_product_ids.add(product_id)
+
+            repres = repres_by_product_id.get(product_id)
+            if repres:
+                representations_ordered.append((product_id, repres))
+        return representations_ordered
+
+    def _collect_last_version_repres(self, project_name, folder_entities):
         """Collect products, versions and representations for folder_entities.
 
         Args:
+            project_name (str): Project name.
             folder_entities (List[Dict[str, Any]]): Folder entities for which
                 want to find data.
 
@@ -683,8 +793,6 @@ class BuildWorkfile:
         ```
         """
 
-        from ayon_core.pipeline.context_tools import get_current_project_name
-
         output = {}
         if not folder_entities:
             return output
@@ -694,7 +802,6 @@ class BuildWorkfile:
             for folder_entity in folder_entities
         }
 
-        project_name = get_current_project_name()
         product_entities = list(ayon_api.get_products(
             project_name, folder_ids=folder_entities_by_id.keys()
         ))
@@ -702,6 +809,8 @@ class BuildWorkfile:
             product_entity["id"]: product_entity
             for product_entity in product_entities
         }
+        if not product_entities_by_id:
+            return output
 
         last_version_by_product_id = ayon_api.get_last_versions(
             project_name, product_entities_by_id.keys()
@@ -710,42 +819,42 @@ class BuildWorkfile:
             version_entity["id"]: version_entity
             for version_entity in last_version_by_product_id.values()
         }
+        if not last_version_entities_by_id:
+            return output
+
         repre_entities = ayon_api.get_representations(
             project_name, version_ids=last_version_entities_by_id.keys()
         )
 
+        repre_entities_by_version_id = collections.defaultdict(list)
         for repre_entity in repre_entities:
             version_id = repre_entity["versionId"]
+            repre_entities_by_version_id[version_id].append(repre_entity)
+
+        for version_id, version_repres in (
+            repre_entities_by_version_id.items()
+        ):
             version_entity = last_version_entities_by_id[version_id]
 
             product_id = version_entity["productId"]
             product_entity = product_entities_by_id[product_id]
 
             folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-
-            if folder_id not in output:
-                output[folder_id] = {
-                    "folder_entity": folder_entity,
+            folder_data = output.get(folder_id)
+            if folder_data is None:
+                folder_data = {
+                    "folder_entity": folder_entities_by_id[folder_id],
                     "products": {}
                 }
-
-            if product_id not in output[folder_id]["products"]:
-                output[folder_id]["products"][product_id] = {
-                    "product_entity": product_entity,
-                    "version": {
-                        "version_entity": version_entity,
-                        "repres": []
-                    }
+                output[folder_id] = folder_data
+
+            # Only last version of product is used
+            folder_data["products"][product_id] = {
+                "product_entity": product_entity,
+                "version": {
+                    "version_entity": version_entity,
+                    "repres": version_repres
                 }
-
-            (
-                output
-                [folder_id]
-                ["products"]
-                [product_id]
-                ["version"]
-                ["repres"]
-            ).append(repre_entity)
+            }
 
         return output
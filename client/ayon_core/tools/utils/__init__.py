@@ -1,84 +1,101 @@
-from .layouts import FlowLayout
-from .widgets import (
-    FocusSpinBox,
-    FocusDoubleSpinBox,
-    ComboBox,
-    CustomTextComboBox,
-    PlaceholderLineEdit,
-    ElideLabel,
-    HintedLineEdit,
-    ExpandingTextEdit,
-    BaseClickableFrame,
-    ClickableFrame,
-    ClickableLabel,
-    ExpandBtn,
-    ClassicExpandBtn,
-    PixmapLabel,
-    IconButton,
-    PixmapButton,
-    SeparatorWidget,
-    PressHoverButton,
-
-    VerticalExpandButton,
-    SquareButton,
-    RefreshButton,
-    GoToCurrentButton,
-)
-from .views import (
-    DeselectableTreeView,
-    TreeView,
-)
-from .error_dialog import ErrorMessageBox
-from .lib import (
-    WrappedCallbackItem,
-    paint_image_with_color,
-    get_warning_pixmap,
-    set_style_property,
-    DynamicQThread,
-    qt_app_context,
-    get_qt_app,
-    get_ayon_qt_app,
-    get_qt_icon,
-)
-
-from .models import (
-    RecursiveSortFilterProxyModel,
-)
-from .overlay_messages import (
-    MessageOverlayObject,
-)
-from .multiselection_combobox import MultiSelectionComboBox
-from .thumbnail_paint_widget import ThumbnailPainterWidget
-from .sliders import NiceSlider
-from .nice_checkbox import NiceCheckbox
-from .dialogs import (
-    show_message_dialog,
-    ScrollMessageBox,
-    SimplePopup,
-    PopupUpdateKeys,
-)
-from .projects_widget import (
-    ProjectsCombobox,
-    ProjectsQtModel,
-    ProjectSortFilterProxy,
-    PROJECT_NAME_ROLE,
-    PROJECT_IS_CURRENT_ROLE,
-    PROJECT_IS_ACTIVE_ROLE,
-    PROJECT_IS_LIBRARY_ROLE,
-)
-
-from .folders_widget import (
-    FoldersWidget,
-    FoldersQtModel,
-    FOLDERS_MODEL_SENDER_NAME,
-    SimpleFoldersWidget,
-)
-
-from .tasks_widget import (
-    TasksWidget,
-    TasksQtModel,
-    TASKS_MODEL_SENDER_NAME,
-)
+"""Qt utils and widgets used across tools.
+
+Attributes are imported lazily on first access, so importing the package
+does not import all widget modules.
+"""
+import importlib
+
+_MODULE_BY_ATTR_NAME = {
+    "FlowLayout": ".layouts",
+
+    "FocusSpinBox": ".widgets",
+    "FocusDoubleSpinBox": ".widgets",
+    "ComboBox": ".widgets",
+    "CustomTextComboBox": ".widgets",
+    "PlaceholderLineEdit": ".widgets",
+    "ElideLabel": ".widgets",
+    "HintedLineEdit": ".widgets",
+    "ExpandingTextEdit": ".widgets",
+    "BaseClickableFrame": ".widgets",
+    "ClickableFrame": ".widgets",
+    "ClickableLabel": ".widgets",
+    "ExpandBtn": ".widgets",
+    "ClassicExpandBtn": ".widgets",
+    "PixmapLabel": ".widgets",
+    "IconButton": ".widgets",
+    "PixmapButton": ".widgets",
+    "SeparatorWidget": ".widgets",
+    "PressHoverButton": ".widgets",
+    "VerticalExpandButton": ".widgets",
+    "SquareButton": ".widgets",
+    "RefreshButton": ".widgets",
+    "GoToCurrentButton": ".widgets",
+
+    "DeselectableTreeView": ".views",
+    "TreeView": ".views",
+
+    "ErrorMessageBox": ".error_dialog",
+
+    "WrappedCallbackItem": ".lib",
+    "paint_image_with_color": ".lib",
+    "get_warning_pixmap": ".lib",
+    "set_style_property": ".lib",
+    "DynamicQThread": ".lib",
+    "qt_app_context": ".lib",
+    "get_qt_app": ".lib",
+    "get_ayon_qt_app": ".lib",
+    "get_qt_icon": ".lib",
+
+    "RecursiveSortFilterProxyModel": ".models",
+
+    "MessageOverlayObject": ".overlay_messages",
+
+    "MultiSelectionComboBox": ".multiselection_combobox",
+
+    "ThumbnailPainterWidget": ".thumbnail_paint_widget",
+
+    "NiceSlider": ".sliders",
+
+    "NiceCheckbox": ".nice_checkbox",
+
+    "show_message_dialog": ".dialogs",
+    "ScrollMessageBox": ".dialogs",
+    "SimplePopup": ".dialogs",
+    "PopupUpdateKeys": ".dialogs",
+
+    "ProjectsCombobox": ".projects_widget",
+    "ProjectsQtModel": ".projects_widget",
+    "ProjectSortFilterProxy": ".projects_widget",
+    "PROJECT_NAME_ROLE": ".projects_widget",
+    "PROJECT_IS_CURRENT_ROLE": ".projects_widget",
+    "PROJECT_IS_ACTIVE_ROLE": ".projects_widget",
+    "PROJECT_IS_LIBRARY_ROLE": ".projects_widget",
+
+    "FoldersWidget": ".folders_widget",
+    "FoldersQtModel": ".folders_widget",
+    "FOLDERS_MODEL_SENDER_NAME": ".folders_widget",
+    "SimpleFoldersWidget": ".folders_widget",
+
+    "TasksWidget": ".tasks_widget",
+    "TasksQtModel": ".tasks_widget",
+    "TASKS_MODEL_SENDER_NAME": ".tasks_widget",
+}
+
+
+def __getattr__(name):
+    module_name = _MODULE_BY_ATTR_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_BY_ATTR_NAME))
 
 
 __all__ = (
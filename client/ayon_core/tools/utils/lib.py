@@ -3,6 +3,7 @@ import sys
 import contextlib
 import collections
 import traceback
+import weakref
 from functools import partial
 from typing import Union, Any
 
@@ -21,38 +22,56 @@ from .constants import CHECKED_INT, UNCHECKED_INT, PARTIALLY_CHECKED_INT
 
 log = Logger.get_logger(__name__)
 
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+_CHECKSTATE_ENUM_BY_INT = {
+    CHECKED_INT: QtCore.Qt.Checked,
+    UNCHECKED_INT: QtCore.Qt.Unchecked,
+}
+_CHECKSTATE_INT_BY_ENUM = {
+    QtCore.Qt.Checked: CHECKED_INT,
+    QtCore.Qt.PartiallyChecked: PARTIALLY_CHECKED_INT,
+}
+
+_PAINT_RENDER_HINTS = (
+    QtGui.QPainter.Antialiasing
+    | QtGui.QPainter.SmoothPixmapTransform
+)
+# Deprecated since 5.14
+if hasattr(QtGui.QPainter, "HighQualityAntialiasing"):
+    _PAINT_RENDER_HINTS |= QtGui.QPainter.HighQualityAntialiasing
+
+_WIDGET_HAS_SCREEN = hasattr(QtWidgets.QWidget, "screen")
+
 
 def checkstate_int_to_enum(state):
     if not isinstance(state, int):
         return state
-    if state == CHECKED_INT:
-        return QtCore.Qt.Checked
-
-    if state == UNCHECKED_INT:
-        return QtCore.Qt.Unchecked
-    return QtCore.Qt.PartiallyChecked
+    return _CHECKSTATE_ENUM_BY_INT.get(state, QtCore.Qt.PartiallyChecked)
 
 
 def checkstate_enum_to_int(state):
     if isinstance(state, int):
         return state
-    if state == QtCore.Qt.Checked:
-        return CHECKED_INT
-    if state == QtCore.Qt.PartiallyChecked:
-        return PARTIALLY_CHECKED_INT
-    return UNCHECKED_INT
+    return _CHECKSTATE_INT_BY_ENUM.get(state, UNCHECKED_INT)
 
 
 def center_window(window):
     """Move window to center of it's screen."""
 
-    if hasattr(QtWidgets.QApplication, "desktop"):
-        desktop = QtWidgets.QApplication.desktop()
-        screen_idx = desktop.screenNumber(window)
-        screen_geo = desktop.screenGeometry(screen_idx)
+    # 'QWidget.screen' is available since Qt 5.14
+    if _WIDGET_HAS_SCREEN:
+        screen_geo = window.screen().geometry()
     else:
-        screen = window.screen()
-        screen_geo = screen.geometry()
+        desktop = QtWidgets.QApplication.desktop()
+        screen_geo = desktop.screenGeometry(desktop.screenNumber(window))
 
     geo = window.frameGeometry()
     geo.moveCenter(screen_geo.center())
@@ -64,14 +83,7 @@ def center_window(window):
 def html_escape(text):
     """Basic escape of html syntax symbols in text."""
 
-    return (
-        text
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#x27;")
-    )
+    return text.translate(_HTML_ESCAPE_TABLE)
 
 
 def set_style_property(widget, property_name, property_value):
@@ -99,26 +111,16 @@ def paint_image_with_color(image, color):
     width = image.width()
     height = image.height()
 
-    alpha_mask = image.createAlphaMask()
-    alpha_region = QtGui.QRegion(QtGui.QBitmap.fromImage(alpha_mask))
-
     pixmap = QtGui.QPixmap(width, height)
     pixmap.fill(QtCore.Qt.transparent)
 
     painter = QtGui.QPainter(pixmap)
-    render_hints = (
-        QtGui.QPainter.Antialiasing
-        | QtGui.QPainter.SmoothPixmapTransform
-    )
-    # Deprecated since 5.14
-    if hasattr(QtGui.QPainter, "HighQualityAntialiasing"):
-        render_hints |= QtGui.QPainter.HighQualityAntialiasing
-    painter.setRenderHints(render_hints)
-
-    painter.setClipRegion(alpha_region)
-    painter.setPen(QtCore.Qt.NoPen)
-    painter.setBrush(color)
-    painter.drawRect(QtCore.QRect(0, 0, width, height))
+    painter.setRenderHints(_PAINT_RENDER_HINTS)
+
+    # Keep alpha of the image and replace its color
+    painter.drawImage(0, 0, image)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
+    painter.fillRect(QtCore.QRect(0, 0, width, height), color)
     painter.end()
 
     return pixmap
@@ -147,6 +149,23 @@ def qt_app_context():
         yield app
 
 
+class _QtAppCache:
+    """Cache of Qt application returned by 'get_qt_app'.
+
+    Only weak references are stored so the cache does not change lifetime
+    of the application.
+    """
+
+    app_ref = None
+    ayon_icon_app_ref = None
+
+    @staticmethod
+    def get_app(app_ref):
+        if app_ref is None:
+            return None
+        return app_ref()
+
+
 def get_qt_app():
     """Get Qt application.
 
@@ -158,6 +177,10 @@ def get_qt_app():
         QtWidgets.QApplication: Current Qt application.
     """
 
+    app = _QtAppCache.get_app(_QtAppCache.app_ref)
+    if app is not None:
+        return app
+
     app = QtWidgets.QApplication.instance()
     if app is None:
         for attr_name in (
@@ -181,6 +204,7 @@ def get_qt_app():
 
         app = QtWidgets.QApplication(sys.argv)
 
+    _QtAppCache.app_ref = weakref.ref(app)
     return app
 
 
@@ -192,7 +216,9 @@ def get_ayon_qt_app():
     """
 
     app = get_qt_app()
-    app.setWindowIcon(QtGui.QIcon(get_app_icon_path()))
+    if _QtAppCache.get_app(_QtAppCache.ayon_icon_app_ref) is not app:
+        app.setWindowIcon(QtGui.QIcon(get_app_icon_path()))
+        _QtAppCache.ayon_icon_app_ref = weakref.ref(app)
     return app
 
 
@@ -401,18 +427,31 @@ class WrappedCallbackItem:
             self._done = True
 
 
+class _WarningPixmapCache:
+    """Cache for warning pixmaps by color."""
+
+    src_image = None
+    pixmaps = {}
+
+
 def get_warning_pixmap(color=None):
     """Warning icon as QPixmap.
 
     Args:
         color(QtGui.QColor): Color that will be used to paint warning icon.
     """
-    src_image_path = get_image_path("warning.png")
-    src_image = QtGui.QImage(src_image_path)
     if color is None:
         color = get_objected_colors("delete-btn-bg").get_qcolor()
 
-    return paint_image_with_color(src_image, color)
+    cache_key = color.rgba()
+    pixmap = _WarningPixmapCache.pixmaps.get(cache_key)
+    if pixmap is None:
+        if _WarningPixmapCache.src_image is None:
+            src_image_path = get_image_path("warning.png")
+            _WarningPixmapCache.src_image = QtGui.QImage(src_image_path)
+        pixmap = paint_image_with_color(_WarningPixmapCache.src_image, color)
+        _WarningPixmapCache.pixmaps[cache_key] = pixmap
+    return pixmap
 
 
 class RefreshThread(QtCore.QThread):
@@ -472,6 +511,8 @@ class _IconsCache:
     _cache = {}
     _default = None
     _qtawesome_cache = {}
+    _qtawesome_variants = {}
+    _qtawesome_charmap = None
 
     @classmethod
     def _get_cache_key(cls, icon_def):
@@ -506,10 +547,9 @@ class _IconsCache:
         elif icon_type == "awesome-font":
             icon_name = icon_def["name"]
             icon_color = icon_def["color"]
-            icon = cls.get_qta_icon_by_name_and_color(icon_name, icon_color)
-            if icon is None:
-                icon = cls.get_qta_icon_by_name_and_color(
-                    "fa.{}".format(icon_name), icon_color)
+            icon = cls.get_qta_icon_by_name_and_color(
+                icon_name, icon_color, "fa.{}".format(icon_name)
+            )
 
         elif icon_type == "material-symbols":
             icon_name = icon_def["name"]
@@ -529,28 +569,23 @@ class _IconsCache:
         return QtGui.QIcon(pix)
 
     @classmethod
-    def get_qta_icon_by_name_and_color(cls, icon_name, icon_color):
-        if not icon_name or not icon_color:
-            return None
-
-        full_icon_name = "{0}-{1}".format(icon_name, icon_color)
-        if full_icon_name in cls._qtawesome_cache:
-            return cls._qtawesome_cache[full_icon_name]
+    def _get_qta_variant(cls, icon_name):
+        # Variant resolved for the icon name does not depend on color
+        if icon_name in cls._qtawesome_variants:
+            return cls._qtawesome_variants[icon_name]
 
-        variants = [icon_name]
-        qta_instance = qtawesome._instance()
-        for key in qta_instance.charmap.keys():
-            variants.append("{0}.{1}".format(key, icon_name))
+        if cls._qtawesome_charmap is None:
+            cls._qtawesome_charmap = qtawesome._instance().charmap
 
-        icon = None
         used_variant = None
-        for variant in variants:
-            try:
-                icon = qtawesome.icon(variant, color=icon_color)
-                used_variant = variant
-                break
-            except Exception:
-                pass
+        prefix, _, name = icon_name.partition(".")
+        if name in cls._qtawesome_charmap.get(prefix, ()):
+            used_variant = icon_name
+        else:
+            for prefix, charmap in cls._qtawesome_charmap.items():
+                if icon_name in charmap:
+                    used_variant = "{0}.{1}".format(prefix, icon_name)
+                    break
 
         if used_variant is None:
             log.info("Didn't find icon \"{}\"".format(icon_name))
@@ -560,6 +595,37 @@ class _IconsCache:
                 icon_name, used_variant
             ))
 
+        cls._qtawesome_variants[icon_name] = used_variant
+        return used_variant
+
+    @classmethod
+    def get_qta_icon_by_name_and_color(
+        cls, icon_name, icon_color, fallback_icon_name=None
+    ):
+        if not icon_name or not icon_color:
+            return None
+
+        full_icon_name = "{0}-{1}".format(icon_name, icon_color)
+        if fallback_icon_name:
+            full_icon_name = "{0}|{1}".format(
+                full_icon_name, fallback_icon_name
+            )
+        if full_icon_name in cls._qtawesome_cache:
+            return cls._qtawesome_cache[full_icon_name]
+
+        used_variant = cls._get_qta_variant(icon_name)
+        if used_variant is None and fallback_icon_name:
+            used_variant = cls._get_qta_variant(fallback_icon_name)
+
+        icon = None
+        if used_variant is not None:
+            try:
+                icon = qtawesome.icon(used_variant, color=icon_color)
+            except Exception:
+                log.info("Failed to create icon \"{}\"".format(
+                    used_variant
+                ))
+
         cls._qtawesome_cache[full_icon_name] = icon
         return icon
 
@@ -577,15 +643,21 @@ def get_qt_icon(icon_def):
     return _IconsCache.get_icon(icon_def)
 
 
-def get_qta_icon_by_name_and_color(icon_name, icon_color):
+def get_qta_icon_by_name_and_color(
+    icon_name, icon_color, fallback_icon_name=None
+):
     """Returns icon from cache or creates new one.
 
     Args:
         icon_name (str): Icon name.
         icon_color (str): Icon color.
+        fallback_icon_name (Optional[str]): Icon name used when icon
+            with 'icon_name' is not found.
 
     Returns:
         QtGui.QIcon: Icon.
 
     """
-    return _IconsCache.get_qta_icon_by_name_and_color(icon_name, icon_color)
+    return _IconsCache.get_qta_icon_by_name_and_color(
+        icon_name, icon_color, fallback_icon_name
+    )
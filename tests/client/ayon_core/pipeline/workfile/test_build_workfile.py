@@ -0,0 +1,134 @@
+import pytest
+
+from ayon_core.pipeline.workfile import build_workfile
+
+
+class MockLoader:
+    """ Mock loader plugin for testing purpose.
+    """
+    enabled = True
+
+
+def _create_folder_data(product_count: int, families: list) -> dict:
+    """ Prepare folder data as returned by '_collect_last_version_repres'.
+    """
+    products = {}
+    for idx in range(product_count):
+        product_id = "product{}".format(idx)
+        version_id = "version{}".format(idx)
+        products[product_id] = {
+            "product_entity": {
+                "id": product_id,
+                "name": "modelMain{}".format(idx),
+                "productType": "model",
+                "data": {"families": families},
+            },
+            "version": {
+                "version_entity": {"id": version_id, "productId": product_id},
+                "repres": [{
+                    "id": "repre{}".format(idx),
+                    "name": "abc",
+                    "versionId": version_id,
+                }],
+            },
+        }
+    return {
+        "folder_entity": {"id": "folder", "path": "/folder"},
+        "products": products,
+    }
+
+
+def _get_representation_contexts(project_name, repre_entities):
+    return {
+        repre_entity["id"]: {
+            "project": {"name": project_name},
+            "folder": {"id": "folder"},
+            "product": {"id": "product"},
+            "version": {"id": repre_entity["versionId"]},
+            "representation": repre_entity,
+        }
+        for repre_entity in repre_entities
+    }
+
+
+def _load_with_repre_context(loader, repre_context, name=None):
+    return name
+
+
+def _create_builder(product_type: str):
+    """ Prepare workfile builder with one current context profile.
+    """
+    profile = {
+        "product_types": [product_type],
+        "loaders": ["MockLoader"],
+        "repre_names": ["abc"],
+        "product_name_filters": [],
+    }
+    builder = build_workfile.BuildWorkfile()
+    builder.build_presets = {
+        "current_context": [profile],
+        "linked_assets": [],
+    }
+    return builder
+
+
+@pytest.mark.parametrize("product_count", [1, 2])
+@pytest.mark.parametrize(
+    "families,preset_product_type",
+    [
+        pytest.param(["model"], "model", id="families_match"),
+        pytest.param(["review"], "model", id="families_differ"),
+        pytest.param([], "Model", id="product_type_case"),
+    ]
+)
+def test_load_containers_by_folder_data(
+    monkeypatch, product_count, families, preset_product_type
+):
+    """ Products matching a profile are loaded regardless of their count.
+    """
+    monkeypatch.setattr(
+        build_workfile,
+        "get_representation_contexts",
+        _get_representation_contexts,
+    )
+    monkeypatch.setattr(
+        build_workfile,
+        "load_with_repre_context",
+        _load_with_repre_context,
+    )
+    builder = _create_builder(preset_product_type)
+
+    loaded_data = builder.load_containers_by_folder_data(
+        "test_project",
+        _create_folder_data(product_count, families),
+        builder.build_presets["current_context"],
+        {"MockLoader": MockLoader},
+    )
+
+    assert sorted(loaded_data["containers"]) == [
+        "modelMain{}".format(idx)
+        for idx in range(product_count)
+    ]
+
+
+def test_load_containers_contexts_query_failed(monkeypatch):
+    """ Failed query of representation contexts doesn't abort the build.
+    """
+    def _get_representation_contexts_failed(*args, **kwargs):
+        raise RuntimeError("Server error")
+
+    monkeypatch.setattr(
+        build_workfile,
+        "get_representation_contexts",
+        _get_representation_contexts_failed,
+    )
+    builder = _create_builder("model")
+
+    loaded_data = builder.load_containers_by_folder_data(
+        "test_project",
+        _create_folder_data(2, ["model"]),
+        builder.build_presets["current_context"],
+        {"MockLoader": MockLoader},
+    )
+
+    assert loaded_data["containers"] == []